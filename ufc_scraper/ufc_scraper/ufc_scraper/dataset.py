@@ -0,0 +1,75 @@
+import json
+import re
+from datetime import datetime
+from functools import lru_cache
+
+DEFAULT_DATASET_FILE = "ufc_fighters_stats_and_records.json"
+
+# Marker the spider writes into winner_id/loser_id when no win plaque is found
+DRAW_NO_CONTEST_ID = "draw-no-contest"
+UNKNOWN_ID = "unknown"
+
+
+def load_fighters(path=DEFAULT_DATASET_FILE):
+    """Load the list of fighters written by the spider"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Fight dates repeat across every fighter on a card, so parsing is cached
+@lru_cache(maxsize=None)
+def parse_fight_date(date_string):
+    """Parse a fight date such as "Mar. 19, 2022" into a date object"""
+    if not date_string or date_string == "N/A":
+        return None
+
+    # Same normalisation as the spider's _format_date: drop periods and commas
+    cleaned = date_string.replace(".", "").replace(",", "").strip()
+    # ufc.com abbreviates September as "Sept."
+    cleaned = cleaned.replace("Sept ", "Sep ")
+
+    for fmt in ("%b %d %Y", "%B %d %Y"):
+        try:
+            return datetime.strptime(cleaned, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_stat(value):
+    """Convert a scraped stat such as "4.53", "48%" or "355 (63%)" to a float"""
+    if not isinstance(value, str):
+        return value
+    value = value.strip()
+
+    # Bare percentages become fractions; counts with a share in brackets keep the count
+    if value.endswith("%") and "(" not in value:
+        try:
+            return float(value[:-1].strip()) / 100
+        except ValueError:
+            return None
+
+    match = re.search(r"\d+(?:\.\d+)?", value)
+    return float(match.group()) if match else None
+
+
+def fight_key(fight, fight_date):
+    """Build a key that is identical for both fighters' copy of the same fight"""
+    first, second = sorted((fight.get("fighter1_id", UNKNOWN_ID), fight.get("fighter2_id", UNKNOWN_ID)))
+    return f"{first}_vs_{second}_{fight_date.isoformat()}"
+
+
+def iter_fights(fighters):
+    """Yield (date, key, fight) for every dated fight, each fight only once"""
+    seen = set()
+    for fighter in fighters:
+        for fight in fighter.get("fight_history", {}).values():
+            fight_date = parse_fight_date(fight.get("date"))
+            if fight_date is None:
+                continue
+
+            key = fight_key(fight, fight_date)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield fight_date, key, fight
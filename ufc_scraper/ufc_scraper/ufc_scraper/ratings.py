@@ -0,0 +1,209 @@
+import json
+import random
+import sys
+import time
+from bisect import bisect_left
+from datetime import date, timedelta
+
+from ufc_scraper.dataset import DRAW_NO_CONTEST_ID, UNKNOWN_ID, iter_fights, load_fighters, parse_fight_date
+
+DEFAULT_RATINGS_FILE = "ufc_fighter_ratings.json"
+
+# Methods that mark a fight without a win plaque as a draw rather than a no contest
+DRAW_METHODS = ("draw", "decision")
+
+
+def fight_outcome(fight):
+    """Return (fighter_a, fighter_b, score_a) for a fight, or None if it should not be rated"""
+    winner_id = fight.get("winner_id")
+
+    if winner_id == DRAW_NO_CONTEST_ID:
+        # Draws pull both ratings together, no contests leave them untouched
+        method = fight.get("method", "").lower()
+        if not any(name in method for name in DRAW_METHODS):
+            return None
+        fighter_a, fighter_b, score_a = fight.get("fighter1_id"), fight.get("fighter2_id"), 0.5
+    else:
+        fighter_a, fighter_b, score_a = winner_id, fight.get("loser_id"), 1.0
+
+    if fighter_a in (None, "", UNKNOWN_ID) or fighter_b in (None, "", UNKNOWN_ID):
+        return None
+    return fighter_a, fighter_b, score_a
+
+
+class RatingEngine:
+    """Elo ratings replayed over the fight history in chronological order"""
+
+    def __init__(self, k_factor=32, initial_rating=1500.0):
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+        self.ratings = {}
+        # Applied fights sorted by (date, key), each stored as
+        # [date, key, fighter_a, fighter_b, score_a, rating_a_before, rating_b_before]
+        self.history = []
+        # Keys of every fight seen so far, rated or not
+        self.seen_keys = set()
+
+    def update(self, fighters):
+        """Apply only the fights in the dataset that have not been seen yet"""
+        new_fights = []
+        for fight_date, key, fight in iter_fights(fighters):
+            if key in self.seen_keys:
+                continue
+            self.seen_keys.add(key)
+
+            outcome = fight_outcome(fight)
+            if outcome:
+                new_fights.append([fight_date.isoformat(), key, *outcome])
+
+        return self._apply(new_fights)
+
+    def _apply(self, new_fights):
+        """Merge new fights into the history, replaying from the earliest affected date"""
+        if not new_fights:
+            return 0
+        new_fights.sort()
+
+        # Everything after the earliest new fight has to be undone and replayed
+        start = bisect_left(self.history, new_fights[0][:2])
+        for entry in reversed(self.history[start:]):
+            self.ratings[entry[2]] = entry[5]
+            self.ratings[entry[3]] = entry[6]
+
+        replay = sorted([entry[:5] for entry in self.history[start:]] + new_fights)
+        del self.history[start:]
+
+        for fight_date, key, fighter_a, fighter_b, score_a in replay:
+            self.history.append(self._rate(fight_date, key, fighter_a, fighter_b, score_a))
+
+        return len(replay)
+
+    def _rate(self, fight_date, key, fighter_a, fighter_b, score_a):
+        """Update both fighters' ratings for one fight and return its history entry"""
+        rating_a = self.ratings.get(fighter_a, self.initial_rating)
+        rating_b = self.ratings.get(fighter_b, self.initial_rating)
+
+        expected_a = 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400.0))
+        delta = self.k_factor * (score_a - expected_a)
+        self.ratings[fighter_a] = rating_a + delta
+        self.ratings[fighter_b] = rating_b - delta
+
+        return [fight_date, key, fighter_a, fighter_b, score_a, rating_a, rating_b]
+
+    def top(self, count=10):
+        """Return the highest rated fighters as (fighter_id, rating) pairs"""
+        return sorted(self.ratings.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    def save(self, path=DEFAULT_RATINGS_FILE):
+        """Save the engine state to a JSON file"""
+        state = {
+            "k_factor": self.k_factor,
+            "initial_rating": self.initial_rating,
+            "ratings": self.ratings,
+            "history": self.history,
+            "seen_keys": sorted(self.seen_keys)
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path=DEFAULT_RATINGS_FILE):
+        """Restore an engine previously written by save()"""
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+
+        engine = cls(k_factor=state["k_factor"], initial_rating=state["initial_rating"])
+        engine.ratings = state["ratings"]
+        engine.history = state["history"]
+        engine.seen_keys = set(state["seen_keys"])
+        return engine
+
+
+def compute_ratings(fighters, k_factor=32, initial_rating=1500.0):
+    """Full recomputation: replay every fight in the dataset from scratch"""
+    engine = RatingEngine(k_factor=k_factor, initial_rating=initial_rating)
+    engine.update(fighters)
+    return engine
+
+
+def _synthetic_fighters(fighter_count=2500, fight_count=20000, seed=0):
+    """Generate spider-shaped fighter records for benchmarking"""
+    rng = random.Random(seed)
+    ids = [f"fighter-{index}" for index in range(fighter_count)]
+    fighters = {fighter_id: {"about": {"id": fighter_id}, "fight_history": {}} for fighter_id in ids}
+    first_day = date(1993, 11, 12)
+
+    for _ in range(fight_count):
+        fighter1_id, fighter2_id = rng.sample(ids, 2)
+        fight_date = first_day + timedelta(days=rng.randrange(11000))
+        roll = rng.random()
+        if roll < 0.02:
+            winner_id, loser_id, method = DRAW_NO_CONTEST_ID, DRAW_NO_CONTEST_ID, "Decision - Split"
+        elif roll < 0.03:
+            winner_id, loser_id, method = DRAW_NO_CONTEST_ID, DRAW_NO_CONTEST_ID, "Overturned"
+        else:
+            winner_id, loser_id = (fighter1_id, fighter2_id) if roll < 0.5 else (fighter2_id, fighter1_id)
+            method = "KO/TKO"
+
+        fight = {
+            "fighter1_id": fighter1_id,
+            "fighter2_id": fighter2_id,
+            "winner_id": winner_id,
+            "loser_id": loser_id,
+            "date": fight_date.strftime("%b. %d, %Y"),
+            "method": method
+        }
+        key = f"{fighter1_id}_vs_{fighter2_id}_{fight_date.isoformat()}"
+        fighters[fighter1_id]["fight_history"][key] = fight
+        fighters[fighter2_id]["fight_history"][key] = fight
+
+    return list(fighters.values())
+
+
+def _split_fighters(fighters, keep):
+    """Copy the fighters keeping only the fights for which keep(fight_date) is true"""
+    split = []
+    for fighter in fighters:
+        history = {}
+        for key, fight in fighter.get("fight_history", {}).items():
+            fight_date = parse_fight_date(fight.get("date"))
+            if fight_date is not None and keep(fight_date):
+                history[key] = fight
+        split.append({**fighter, "fight_history": history})
+    return split
+
+
+def benchmark(fighters=None):
+    """Compare a full recomputation with incremental updates for a new crawl"""
+    fighters = fighters if fighters is not None else _synthetic_fighters()
+    fight_dates = sorted(fight_date for fight_date, _, _ in iter_fights(fighters))
+    cutoff = fight_dates[int(len(fight_dates) * 0.99)]
+
+    start = time.perf_counter()
+    full = compute_ratings(fighters)
+    full_time = time.perf_counter() - start
+
+    # A crawl whose fights are all dated after everything already applied
+    engine = compute_ratings(_split_fighters(fighters, lambda d: d < cutoff))
+    crawl = _split_fighters(fighters, lambda d: d >= cutoff)
+    start = time.perf_counter()
+    appended_replayed = engine.update(crawl)
+    appended_time = time.perf_counter() - start
+
+    # A crawl that back-fills fights older than the most recent week: bounded replay
+    recent = fight_dates[-1] - timedelta(days=7)
+    engine = compute_ratings(_split_fighters(fighters, lambda d: d < cutoff or d > recent))
+    crawl = _split_fighters(fighters, lambda d: cutoff <= d <= recent)
+    start = time.perf_counter()
+    late_replayed = engine.update(crawl)
+    late_time = time.perf_counter() - start
+
+    drift = max(abs(engine.ratings[fighter_id] - rating) for fighter_id, rating in full.ratings.items())
+    print(f"Full recompute:       {len(full.history)} fights in {full_time * 1000:.1f} ms")
+    print(f"Incremental append:   {appended_replayed} fights in {appended_time * 1000:.1f} ms")
+    print(f"Out-of-order insert:  {late_replayed} fights in {late_time * 1000:.1f} ms")
+    print(f"Max rating difference vs full recompute: {drift:.6f}")
+
+
+if __name__ == "__main__":
+    benchmark(load_fighters(sys.argv[1]) if len(sys.argv) > 1 else None)
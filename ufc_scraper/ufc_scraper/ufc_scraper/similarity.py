@@ -0,0 +1,196 @@
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from ufc_scraper.dataset import load_fighters, parse_stat
+
+DEFAULT_INDEX_FILE = "ufc_fighter_similarity"
+
+# Scraped stats used as-is, keyed by the labels the spider writes into "stats"
+RATE_STATS = [
+    "Sig. Str. Landed Per Min",
+    "Sig. Str. Absorbed Per Min",
+    "Takedown avg Per 15 Min",
+    "Submission avg Per 15 Min",
+    "Sig. Str. Defense",
+    "Knockdown Avg",
+]
+
+# Stats compared as each fighter's share of the group total rather than raw counts
+SHARE_GROUPS = [
+    ["Standing", "Clinch", "Ground"],
+    ["Head", "Body", "Leg"],
+]
+
+FEATURES = ["Striking Accuracy"] + RATE_STATS + [label for group in SHARE_GROUPS for label in group]
+
+# Rows scored per matrix product in whole-roster queries, bounds the score matrix memory
+BATCH_SIZE = 1024
+
+
+def fighter_features(stats):
+    """Return the feature vector for one fighter's stats, with NaN for missing values"""
+    features = []
+
+    landed = parse_stat(stats.get("Sig. Strikes Landed"))
+    attempted = parse_stat(stats.get("Sig. Strikes Attempted"))
+    features.append(landed / attempted if landed is not None and attempted else np.nan)
+
+    for label in RATE_STATS:
+        value = parse_stat(stats.get(label))
+        features.append(np.nan if value is None else value)
+
+    for group in SHARE_GROUPS:
+        values = [parse_stat(stats.get(label)) for label in group]
+        total = sum(value for value in values if value is not None)
+        for value in values:
+            features.append(value / total if value is not None and total else np.nan)
+
+    return features
+
+
+class SimilarityIndex:
+    """Cosine similarity over standardised fighter stat vectors"""
+
+    def __init__(self, ids, divisions, matrix):
+        self.ids = ids
+        self.divisions = divisions
+        # One unit-length float32 row per fighter, possibly memory-mapped
+        self.matrix = matrix
+        self.positions = {fighter_id: row for row, fighter_id in enumerate(ids)}
+
+    @classmethod
+    def build(cls, fighters):
+        """Build the index from the fighters written by the spider"""
+        ids, divisions, rows = [], [], []
+        for fighter in fighters:
+            stats = fighter.get("stats")
+            about = fighter.get("about", {})
+            if not stats or "id" not in about:
+                continue
+            ids.append(about["id"])
+            divisions.append(about.get("division", ""))
+            rows.append(fighter_features(stats))
+
+        matrix = np.array(rows, dtype=np.float32).reshape(len(rows), len(FEATURES))
+
+        # Standardise each feature, then treat missing values as the roster average
+        with np.errstate(invalid="ignore"):
+            mean = np.nanmean(matrix, axis=0)
+            std = np.nanstd(matrix, axis=0)
+        std[~(std > 0)] = 1.0
+        matrix = np.nan_to_num((matrix - np.nan_to_num(mean)) / std)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return cls(ids, divisions, (matrix / norms).astype(np.float32))
+
+    def save(self, path=DEFAULT_INDEX_FILE):
+        """Write the matrix to <path>.npy and the fighter ids to <path>.json"""
+        np.save(f"{path}.npy", self.matrix)
+        with open(f"{path}.json", "w", encoding="utf-8") as f:
+            json.dump({"features": FEATURES, "ids": self.ids, "divisions": self.divisions}, f, ensure_ascii=False)
+
+    @classmethod
+    def open(cls, path=DEFAULT_INDEX_FILE):
+        """Open a saved index, memory-mapping the matrix instead of reading it"""
+        with open(f"{path}.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return cls(meta["ids"], meta["divisions"], np.load(f"{path}.npy", mmap_mode="r"))
+
+    def most_similar(self, fighter_ids, k=10, division=None):
+        """Return the k most similar fighters for each id as lists of (fighter_id, score)"""
+        candidates = np.arange(len(self.ids))
+        if division is not None:
+            candidates = np.flatnonzero(np.asarray(self.divisions) == division)
+
+        results = []
+        for start in range(0, len(fighter_ids), BATCH_SIZE):
+            batch = fighter_ids[start:start + BATCH_SIZE]
+            results.extend(self._query(np.array([self.positions[fighter_id] for fighter_id in batch]), candidates, k))
+        return results
+
+    def _query(self, rows, candidates, k):
+        """Score a batch of rows against the candidate rows and pick the top k for each"""
+        scores = self.matrix[rows] @ self.matrix[candidates].T
+
+        # A fighter is never reported as similar to themselves
+        scores[rows[:, None] == candidates[None, :]] = -np.inf
+
+        k = min(k, len(candidates))
+        if k == 0:
+            return [[] for _ in rows]
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        return [
+            [
+                (self.ids[candidates[column]], float(score))
+                for column, score in zip(columns, row_scores) if score != -np.inf
+            ]
+            for columns, row_scores in zip(top, top_scores)
+        ]
+
+
+def _synthetic_fighters(fighter_count=2500, seed=0):
+    """Generate spider-shaped fighter stats for benchmarking"""
+    rng = random.Random(seed)
+    divisions = ["Flyweight Division", "Bantamweight Division", "Featherweight Division", "Lightweight Division",
+                 "Welterweight Division", "Middleweight Division", "Light Heavyweight Division", "Heavyweight Division"]
+    fighters = []
+    for index in range(fighter_count):
+        attempted = rng.randint(50, 3000)
+        stats = {
+            "Sig. Strikes Landed": str(rng.randint(0, attempted)),
+            "Sig. Strikes Attempted": str(attempted),
+            "Sig. Str. Defense": f"{rng.randint(30, 70)}%",
+            "Knockdown Avg": f"{rng.uniform(0, 2):.2f}"
+        }
+        for label in RATE_STATS[:4]:
+            stats[label] = f"{rng.uniform(0, 8):.2f}"
+        for group in SHARE_GROUPS:
+            for label in group:
+                stats[label] = f"{rng.randint(0, 500)} ({rng.randint(0, 100)}%)"
+        fighters.append({"about": {"id": f"fighter-{index}", "division": rng.choice(divisions)}, "stats": stats})
+    return fighters
+
+
+def benchmark(fighters=None):
+    """Time building and opening the index and a top-k query for the whole roster"""
+    fighters = fighters if fighters is not None else _synthetic_fighters()
+    path = os.path.join(tempfile.mkdtemp(), DEFAULT_INDEX_FILE)
+
+    start = time.perf_counter()
+    index = SimilarityIndex.build(fighters)
+    index.save(path)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = SimilarityIndex.open(path)
+    open_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index.most_similar(index.ids, k=10)
+    query_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index.most_similar(index.ids, k=10, division=index.divisions[0])
+    division_time = time.perf_counter() - start
+
+    print(f"Build and save:            {len(index.ids)} fighters in {build_time * 1000:.1f} ms")
+    print(f"Open (memory-mapped):      {open_time * 1000:.1f} ms")
+    print(f"Top 10 for whole roster:   {query_time * 1000:.1f} ms")
+    print(f"Top 10 within a division:  {division_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    benchmark(load_fighters(sys.argv[1]) if len(sys.argv) > 1 else None)